@@ -1,5 +1,6 @@
-from functools import reduce
-from typing import Any, Generic, TypeVar
+import weakref
+from collections.abc import Callable
+from typing import Any, ClassVar, Generic, TypeVar
 
 import frappe
 from frappe.model.document import Document
@@ -8,27 +9,73 @@ T = TypeVar("T", bound=Document)
 
 
 class BaseFactory(Generic[T]):
+    # Factories only hold the traits and overrides they were called with.
+    # Subclasses that don't need extra instance state can declare
+    # `__slots__ = ()` to avoid a per-instance `__dict__` as well
+    __slots__ = ("factory_traits", "overrides", "_trait_fgets")
+
     factory_traits: list[str]
     doctype: str
     overrides: dict[str, Any]
+    _trait_fgets: tuple[Callable[[Any], dict[str, Any]], ...]
+
+    # Names of the traits of the factory, collected by `__init_subclass__`
+    _valid_traits: ClassVar[frozenset[str]] = frozenset()
+    # Subclasses created by `_attach_del`, keyed on the document class. Each
+    # factory gets its own cache in `__init_subclass__`
+    _del_subclass_cache: ClassVar[
+        weakref.WeakKeyDictionary[type, weakref.ref[type]]
+    ] = weakref.WeakKeyDictionary()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Collects the names of the traits of the factory when it is defined.
+
+        A trait is any property defined on the factory, or on any of the
+        classes it inherits from, other than the properties of `BaseFactory`
+        itself. Walking the MRO from the base down lets a subclass hide an
+        inherited trait by redefining the name as something else.
+        """
+        super().__init_subclass__(**kwargs)
+
+        traits: set[str] = set()
+        for klass in reversed(cls.__mro__):
+            if klass in BaseFactory.__mro__:
+                continue
+            for name, value in vars(klass).items():
+                if isinstance(value, property):
+                    traits.add(name)
+                else:
+                    traits.discard(name)
+        cls._valid_traits = frozenset(traits.difference(vars(BaseFactory)))
+        cls._del_subclass_cache = weakref.WeakKeyDictionary()
 
     @classmethod
     def build(cls, *_factory_traits: str, **overrides: Any) -> T:
+        # Flags are set on the built document, they are not a document field
+        flags = overrides.pop("flags", None)
         instance = cls(*_factory_traits)
         instance.overrides = overrides
-        # Assign doctype last so that it cannot be overridden
-        doctype: T = frappe.get_doc(
-            {**instance.attributes, **overrides, "doctype": instance.doctype}
-        )
-        doctype.flags.update(overrides.get("flags", {}))
 
-        return doctype
+        return cls._build_from(instance, flags, frappe.get_doc)
 
     @classmethod
     def build_list(
         cls, n: int, *_factory_traits: str, **overrides: Any
     ) -> list[T]:
-        return [cls.build(*_factory_traits, **overrides) for _ in range(n)]
+        # The traits and overrides are the same for every document so the
+        # factory (and its trait validation) is only set up once. Attributes
+        # are still evaluated per document as traits may create related records.
+        # Note that this means the list methods don't go through `build` and
+        # `create`, so overriding those doesn't affect `build_list`/`create_list`
+        flags = overrides.pop("flags", None)
+        instance = cls(*_factory_traits)
+        instance.overrides = overrides
+
+        # Looked up at call time, rather than at import, so that it can be patched
+        get_doc = frappe.get_doc
+
+        return [cls._build_from(instance, flags, get_doc) for _ in range(n)]
 
     @classmethod
     def create(cls, *_factory_traits: str, **overrides: Any) -> T:
@@ -42,7 +89,44 @@ class BaseFactory(Generic[T]):
     def create_list(
         cls, n: int, *_factory_traits: str, **overrides: Any
     ) -> list[T]:
-        return [cls.create(*_factory_traits, **overrides) for _ in range(n)]
+        flags = overrides.pop("flags", None)
+        instance = cls(*_factory_traits)
+        instance.overrides = overrides
+
+        get_doc = frappe.get_doc
+
+        return [cls._create_from(instance, flags, get_doc) for _ in range(n)]
+
+    @classmethod
+    def _build_from(
+        cls,
+        instance: "BaseFactory[T]",
+        flags: dict[str, Any] | None,
+        get_doc: Callable[[dict[str, Any]], T],
+    ) -> T:
+        # `attributes` is a fresh dict so it can be updated in place
+        attributes = instance.attributes
+        attributes.update(instance.overrides)
+        # Assign doctype last so that it cannot be overridden
+        attributes["doctype"] = cls.doctype
+        doctype = get_doc(attributes)
+        if flags:
+            doctype.flags.update(flags)
+
+        return doctype
+
+    @classmethod
+    def _create_from(
+        cls,
+        instance: "BaseFactory[T]",
+        flags: dict[str, Any] | None,
+        get_doc: Callable[[dict[str, Any]], T],
+    ) -> T:
+        doctype = cls._build_from(instance, flags, get_doc)
+        doctype.insert()
+        cls._attach_del(doctype)
+
+        return doctype
 
     def __init__(self, *factory_traits: str) -> None:
         self.factory_traits = list(factory_traits)
@@ -50,20 +134,23 @@ class BaseFactory(Generic[T]):
         # Making sure that we don't use a trait that does not exist - it would be
         # nice if we could do this at compile time but the typing is very funky.
         # What we'd want to assert is that the instance attribute `traits` is an
-        # enum of what `valid_traits` below produces. We would want to declare
-        # this type in `BaseFactory` and apply to each subclass in the context
-        # of the subclass. It doesn't seem like this is possible in Python and
-        # therefore we need to do a runtime check. Given that this is only class
-        # used in the context of testing this is ok
-        valid_traits = [
-            name
-            for name, value in self.__class__.__dict__.items()
-            if isinstance(value, property) and name != "default_attributes"
-        ]
-        if not set(self.factory_traits).issubset(valid_traits):
-            raise TypeError(
-                f"traits ({self.factory_traits}) must be a subset of the set of valid traits ({valid_traits})"
-            )
+        # enum of the `_valid_traits` collected in `__init_subclass__`. We would
+        # want to declare this type in `BaseFactory` and apply to each subclass
+        # in the context of the subclass. It doesn't seem like this is possible
+        # in Python and therefore we need to do a runtime check. Given that this
+        # is only class used in the context of testing this is ok
+        valid_traits = type(self)._valid_traits
+        for trait in self.factory_traits:
+            if trait not in valid_traits:
+                raise TypeError(
+                    f"trait {trait!r} is not valid, traits ({self.factory_traits}) must be a subset of the set of valid traits ({sorted(valid_traits)})"
+                )
+
+        # Resolve the trait getters once so that `attributes` doesn't go through
+        # the attribute lookup and descriptor protocol for every trait it merges
+        self._trait_fgets = tuple(
+            getattr(type(self), trait).fget for trait in self.factory_traits
+        )
 
     @classmethod
     def _attach_del(cls, obj: Any) -> None:
@@ -81,27 +168,54 @@ class BaseFactory(Generic[T]):
         class of the object instead of th object itself. So just attaching it on
         the object itself doesn't work.
 
+        Creating a class is expensive so the temporary subclass is reused for
+        every object of the same class while it is alive. The cache only holds
+        weak references: the subclass references the original class, so
+        holding it strongly would keep both alive forever, which matters for
+        mocked documents as every MagicMock instance has its own class.
+
         Args:
             obj (Any): The object to which the custom __del__ method will be attached.
         """
-        TempSubclass = type(
-            "TempSubclass",
-            (obj.__class__,),  # inherit from the original class
-            {"__del__": cls.__del_override__},  # override __del__
-        )
+        original_class = obj.__class__
+        cached = cls._del_subclass_cache.get(original_class)
+        TempSubclass = cached() if cached is not None else None
+        if TempSubclass is None:
+            TempSubclass = type(
+                "TempSubclass",
+                (original_class,),  # inherit from the original class
+                # override __del__, looking the override up when the object is
+                # deleted so that patching or reassigning it is picked up
+                {"__del__": lambda _self: cls.__del_override__(_self)},
+            )
+            cls._del_subclass_cache[original_class] = weakref.ref(TempSubclass)
         obj.__class__ = TempSubclass
 
     @property
     def default_attributes(self) -> dict[str, Any]:
+        """
+        Default values for the document built by the factory.
+
+        The factory makes a shallow copy of the dicts returned by
+        `default_attributes` or by traits before merging them. Subclasses
+        whose values are constant can therefore return a dict stored on the
+        class instead of rebuilding a literal on every build, as long as the
+        dict is flat and its values are immutable: nested values like child
+        table rows are shared with every built document, and Frappe updates
+        child rows in place. Traits that depend on `self.overrides` or that
+        create related records must keep returning a fresh value, which is why
+        these results are not memoized here.
+        """
         return {}
 
     @property
     def attributes(self) -> dict[str, Any]:
-        return reduce(
-            lambda acc, el: {**acc, **getattr(self, el)},
-            self.factory_traits,
-            self.default_attributes,
-        )
+        # Always return a copy as callers are free to update the result in place
+        attributes = dict(self.default_attributes)
+        for fget in self._trait_fgets:
+            attributes.update(fget(self))
+
+        return attributes
 
     @staticmethod
     def __del_override__(_self: Any) -> None:
@@ -1,3 +1,4 @@
+import gc
 import unittest
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -13,6 +14,20 @@ class TestDocType(Document):  # type: ignore
     flags: dict[str, Any] = {}
 
 
+class _DocStub:
+    """
+    Lightweight stand-in for the documents returned by frappe.get_doc
+
+    MagicMock(spec=...) introspects the spec class every time it is created,
+    which adds up in the list tests. Only `insert` needs to record calls
+    """
+
+    def __init__(self, name: str | None = None) -> None:
+        self.name = name
+        self.insert = MagicMock()
+        self.flags: dict[str, Any] = {}
+
+
 class MockFactory(BaseFactory[TestDocType]):
     """Test factory for testing BaseFactory functionality"""
 
@@ -54,14 +69,59 @@ class MockFactoryNoDefaults(BaseFactory[Document]):
         return {"name": "Basic Document", "field1": "basic_value"}
 
 
+class MockFactoryConstantAttributes(BaseFactory[Document]):
+    """Test factory returning class-level dicts from its properties"""
+
+    doctype = "Constant DocType"
+
+    _defaults: dict[str, Any] = {"name": "Constant Document", "field1": "constant"}
+    _with_field2: dict[str, Any] = {"field2": "trait_value"}
+
+    @property
+    def default_attributes(self) -> dict[str, Any]:
+        return self._defaults
+
+    @property
+    def with_field2(self) -> dict[str, Any]:
+        return self._with_field2
+
+    @property
+    def with_items(self) -> dict[str, Any]:
+        # Nested values can't be shared through a class-level dict
+        return {"items": [{"item_code": "ITEM-001"}]}
+
+
+class MockFactorySequence(BaseFactory[Document]):
+    """Test factory with a trait that returns a different value on each call"""
+
+    doctype = "Sequence DocType"
+
+    sequence = 0
+
+    @property
+    def with_sequence(self) -> dict[str, Any]:
+        MockFactorySequence.sequence += 1
+        return {"name": f"Document {MockFactorySequence.sequence}"}
+
+
+class MockFactorySlots(BaseFactory[Document]):
+    """Test factory declaring empty __slots__"""
+
+    __slots__ = ()
+
+    doctype = "Slots DocType"
+
+    @property
+    def with_basic_fields(self) -> dict[str, Any]:
+        return {"name": "Slots Document"}
+
+
 class TestBaseFactory(unittest.TestCase):
     """Comprehensive tests for BaseFactory class"""
 
     def setUp(self) -> None:
         """Set up test environment"""
-        self.mock_doc = MagicMock(spec=TestDocType)
-        self.mock_doc.name = "test-document-001"
-        self.mock_doc.insert = MagicMock()
+        self.mock_doc = _DocStub("test-document-001")
 
     @patch("frappe.get_doc")
     def test_build_creates_unsaved_document(self, mock_get_doc: MagicMock) -> None:
@@ -143,6 +203,38 @@ class TestBaseFactory(unittest.TestCase):
         )
         self.assertEqual(result, self.mock_doc)
 
+    @patch("frappe.get_doc")
+    def test_build_with_flags(self, mock_get_doc: MagicMock) -> None:
+        """Test that build() sets flags on the document instead of passing them as a field"""
+        mock_get_doc.return_value = self.mock_doc
+
+        result = MockFactory.build(flags={"ignore_permissions": True})
+
+        mock_get_doc.assert_called_once_with(
+            {
+                "name": "Test Document",
+                "field1": "default_value1",
+                "field2": 100,
+                "is_active": 1,
+                "doctype": "Test DocType",
+            }
+        )
+        self.assertEqual(self.mock_doc.flags, {"ignore_permissions": True})
+        self.assertEqual(result, self.mock_doc)
+
+    @patch("frappe.get_doc")
+    def test_build_without_flags_leaves_flags_untouched(
+        self, mock_get_doc: MagicMock
+    ) -> None:
+        """Test that build() doesn't update the document flags when no flags are given"""
+        mock_doc = MagicMock(spec=TestDocType)
+        mock_get_doc.return_value = mock_doc
+
+        MockFactory.build()
+        MockFactory.build(flags={})
+
+        mock_doc.flags.update.assert_not_called()
+
     @patch("frappe.get_doc")
     def test_create_saves_document(self, mock_get_doc: MagicMock) -> None:
         """Test that create() saves the document"""
@@ -164,6 +256,33 @@ class TestBaseFactory(unittest.TestCase):
         mock_attach_del.assert_called_once_with(self.mock_doc)
         self.assertEqual(result, self.mock_doc)
 
+    @patch("frappe.get_doc")
+    def test_create_uses_overridden_build(self, mock_get_doc: MagicMock) -> None:
+        """Test that create() goes through build() so that subclasses can override it"""
+        mock_get_doc.return_value = self.mock_doc
+
+        class OwnerFactory(MockFactory):
+            @classmethod
+            def build(cls, *_factory_traits: str, **overrides: Any) -> TestDocType:
+                return super().build(*_factory_traits, owner="custom", **overrides)
+
+        with patch.object(OwnerFactory, "_attach_del") as mock_attach_del:
+            result = OwnerFactory.create()
+
+        mock_get_doc.assert_called_once_with(
+            {
+                "name": "Test Document",
+                "field1": "default_value1",
+                "field2": 100,
+                "is_active": 1,
+                "owner": "custom",  # from the overridden build
+                "doctype": "Test DocType",
+            }
+        )
+        self.mock_doc.insert.assert_called_once()
+        mock_attach_del.assert_called_once_with(self.mock_doc)
+        self.assertEqual(result, self.mock_doc)
+
     @patch("frappe.get_doc")
     def test_create_with_traits_and_overrides(self, mock_get_doc: MagicMock) -> None:
         """Test that create() works with traits and overrides"""
@@ -189,7 +308,7 @@ class TestBaseFactory(unittest.TestCase):
     @patch("frappe.get_doc")
     def test_build_list(self, mock_get_doc: MagicMock) -> None:
         """Test that build_list() creates multiple unsaved documents"""
-        mock_docs = [MagicMock(spec=TestDocType) for _ in range(3)]
+        mock_docs = [_DocStub() for _ in range(3)]
         mock_get_doc.side_effect = mock_docs
 
         result = MockFactory.build_list(3)
@@ -205,7 +324,7 @@ class TestBaseFactory(unittest.TestCase):
         self, mock_get_doc: MagicMock
     ) -> None:
         """Test that build_list() applies traits and overrides to all documents"""
-        mock_docs = [MagicMock(spec=TestDocType) for _ in range(2)]
+        mock_docs = [_DocStub() for _ in range(2)]
         mock_get_doc.side_effect = mock_docs
 
         result = MockFactory.build_list(2, "with_custom_name", field1="list_override")
@@ -224,10 +343,46 @@ class TestBaseFactory(unittest.TestCase):
         for call in mock_get_doc.call_args_list:
             self.assertEqual(call[0][0], expected_call_args)
 
+    @patch("frappe.get_doc")
+    def test_build_list_evaluates_traits_per_document(
+        self, mock_get_doc: MagicMock
+    ) -> None:
+        """Test that build_list() evaluates traits again for every document"""
+        MockFactorySequence.sequence = 0
+
+        MockFactorySequence.build_list(2, "with_sequence")
+
+        self.assertEqual(
+            [call[0][0]["name"] for call in mock_get_doc.call_args_list],
+            ["Document 1", "Document 2"],
+        )
+
+    @patch("frappe.get_doc")
+    def test_list_methods_instantiate_the_factory_once(
+        self, mock_get_doc: MagicMock
+    ) -> None:
+        """Test that build_list() and create_list() reuse a single factory instance"""
+        with (
+            patch.object(
+                MockFactory,
+                "__init__",
+                autospec=True,
+                side_effect=MockFactory.__init__,
+            ) as mock_init,
+            patch.object(MockFactory, "_attach_del"),
+        ):
+            MockFactory.build_list(3, "with_numbers")
+            self.assertEqual(mock_init.call_count, 1)
+
+            MockFactory.create_list(3, "with_numbers")
+            self.assertEqual(mock_init.call_count, 2)
+
+        self.assertEqual(mock_get_doc.call_count, 6)
+
     @patch("frappe.get_doc")
     def test_create_list(self, mock_get_doc: MagicMock) -> None:
         """Test that create_list() creates and saves multiple documents"""
-        mock_docs = [MagicMock(spec=TestDocType) for _ in range(3)]
+        mock_docs = [_DocStub() for _ in range(3)]
         mock_get_doc.side_effect = mock_docs
 
         with patch.object(MockFactory, "_attach_del") as mock_attach_del:
@@ -247,7 +402,7 @@ class TestBaseFactory(unittest.TestCase):
         self, mock_get_doc: MagicMock
     ) -> None:
         """Test that create_list() applies traits and overrides to all documents"""
-        mock_docs = [MagicMock(spec=TestDocType) for _ in range(2)]
+        mock_docs = [_DocStub() for _ in range(2)]
         mock_get_doc.side_effect = mock_docs
 
         with patch.object(MockFactory, "_attach_del") as mock_attach_del:
@@ -278,6 +433,7 @@ class TestBaseFactory(unittest.TestCase):
             "must be a subset of the set of valid traits", str(context.exception)
         )
         self.assertIn("invalid_trait", str(context.exception))
+        self.assertIn("trait 'invalid_trait' is not valid", str(context.exception))
 
     def test_valid_traits_detection(self) -> None:
         """Test that valid traits are correctly detected"""
@@ -298,6 +454,57 @@ class TestBaseFactory(unittest.TestCase):
         except TypeError:
             self.fail("Valid traits should not raise TypeError")
 
+    def test_valid_traits_are_computed_per_class(self) -> None:
+        """Test that valid traits are computed once for each factory class"""
+        self.assertEqual(
+            MockFactory._valid_traits,
+            frozenset({"with_custom_name", "with_special_fields", "with_numbers"}),
+        )
+        self.assertEqual(
+            MockFactoryNoDefaults._valid_traits, frozenset({"with_basic_fields"})
+        )
+
+    @patch("frappe.get_doc")
+    def test_inherited_traits_are_valid(self, mock_get_doc: MagicMock) -> None:
+        """Test that traits defined on a parent factory can be used by subclasses"""
+        mock_get_doc.return_value = self.mock_doc
+
+        class ChildFactory(MockFactory):
+            @property
+            def with_child_field(self) -> dict[str, Any]:
+                return {"field5": "child_value"}
+
+        class GrandchildFactory(ChildFactory):
+            # Redefining a trait as something other than a property hides it
+            with_numbers = None  # type: ignore[assignment]
+
+        ChildFactory.build("with_numbers", "with_child_field")
+
+        mock_get_doc.assert_called_once_with(
+            {
+                "name": "Test Document",
+                "field1": "default_value1",
+                "field2": 999,  # from the inherited with_numbers trait
+                "field4": 42,  # from the inherited with_numbers trait
+                "field5": "child_value",  # from with_child_field trait
+                "is_active": 1,
+                "doctype": "Test DocType",
+            }
+        )
+        self.assertEqual(
+            GrandchildFactory._valid_traits,
+            frozenset({"with_custom_name", "with_special_fields", "with_child_field"}),
+        )
+
+    def test_patched_trait_is_used_after_earlier_builds(self) -> None:
+        """Test that patching a trait takes effect even if the traits were used before"""
+        self.assertEqual(MockFactory("with_numbers").attributes["field2"], 999)
+
+        with patch.object(
+            MockFactory, "with_numbers", property(lambda self: {"field2": -1})
+        ):
+            self.assertEqual(MockFactory("with_numbers").attributes["field2"], -1)
+
     @patch("frappe.get_doc")
     def test_empty_default_attributes(self, mock_get_doc: MagicMock) -> None:
         """Test factory with empty default attributes"""
@@ -333,6 +540,51 @@ class TestBaseFactory(unittest.TestCase):
         )
         self.assertEqual(result, self.mock_doc)
 
+    @patch("frappe.get_doc")
+    def test_class_level_attributes_are_not_mutated(
+        self, mock_get_doc: MagicMock
+    ) -> None:
+        """Test that dicts returned by default_attributes and traits are never mutated"""
+        mock_get_doc.return_value = self.mock_doc
+
+        MockFactoryConstantAttributes.build()
+        MockFactoryConstantAttributes.build("with_field2", field1="override")
+        MockFactoryConstantAttributes.build_list(2, field2="list_override")
+
+        self.assertEqual(
+            MockFactoryConstantAttributes._defaults,
+            {"name": "Constant Document", "field1": "constant"},
+        )
+        self.assertEqual(
+            MockFactoryConstantAttributes._with_field2, {"field2": "trait_value"}
+        )
+        mock_get_doc.assert_called_with(
+            {
+                "name": "Constant Document",
+                "field1": "constant",
+                "field2": "list_override",
+                "doctype": "Constant DocType",
+            }
+        )
+
+    @patch("frappe.get_doc")
+    def test_nested_attributes_are_not_shared_between_documents(
+        self, mock_get_doc: MagicMock
+    ) -> None:
+        """Test that nested values returned as fresh literals are not shared between documents"""
+        MockFactoryConstantAttributes.build_list(2, "with_items")
+
+        first, second = (call[0][0] for call in mock_get_doc.call_args_list)
+        # Frappe sets the doctype of child rows in place when building a document
+        first["items"][0]["doctype"] = "Item Row"
+        first["items"].append({"item_code": "ITEM-002"})
+
+        self.assertEqual(second["items"], [{"item_code": "ITEM-001"}])
+        self.assertEqual(
+            MockFactoryConstantAttributes._defaults,
+            {"name": "Constant Document", "field1": "constant"},
+        )
+
     def test_attach_del_creates_temp_subclass(self) -> None:
         """Test that _attach_del creates a temporary subclass with custom __del__"""
         mock_obj = MagicMock()
@@ -348,6 +600,54 @@ class TestBaseFactory(unittest.TestCase):
         # Should have the custom __del__ method
         self.assertTrue(hasattr(mock_obj.__class__, "__del__"))
 
+    def test_attach_del_reuses_temp_subclass(self) -> None:
+        """Test that _attach_del reuses the temporary subclass for the same class"""
+
+        class Doc:
+            pass
+
+        first, second = Doc(), Doc()
+
+        MockFactory._attach_del(first)
+        MockFactory._attach_del(second)
+
+        self.assertIs(first.__class__, second.__class__)
+        self.assertTrue(issubclass(first.__class__, Doc))
+
+        # A different factory gets its own subclass as it has its own __del__
+        other = Doc()
+        MockFactoryNoDefaults._attach_del(other)
+        self.assertIsNot(other.__class__, first.__class__)
+
+    def test_attach_del_uses_the_current_del_override(self) -> None:
+        """Test that __del_override__ is looked up when the object is deleted"""
+
+        class Doc:
+            pass
+
+        first = Doc()
+        MockFactory._attach_del(first)
+
+        second = Doc()
+        with patch.object(MockFactory, "__del_override__") as mock_del_override:
+            MockFactory._attach_del(second)
+            self.assertIs(first.__class__, second.__class__)
+
+            del second
+            mock_del_override.assert_called_once()
+
+    def test_attach_del_does_not_keep_classes_alive(self) -> None:
+        """Test that _attach_del doesn't keep the classes of deleted objects alive"""
+
+        class TempFactory(BaseFactory[Document]):
+            doctype = "Temp DocType"
+
+        for _ in range(100):
+            TempFactory._attach_del(MagicMock())
+        gc.collect()
+
+        self.assertEqual(len(TempFactory._del_subclass_cache), 0)
+
     def test_del_override_is_callable(self) -> None:
         """Test that __del_override__ method is callable and doesn't raise errors"""
         # This should not raise any errors
@@ -382,6 +682,14 @@ class TestBaseFactory(unittest.TestCase):
         self.assertEqual(instance.overrides["field1"], "test_override")
         self.assertEqual(instance.overrides["field2"], 999)
 
+    def test_factory_with_empty_slots_has_no_dict(self) -> None:
+        """Test that a factory declaring empty __slots__ has no instance __dict__"""
+        factory = MockFactorySlots("with_basic_fields")
+        factory.overrides = {}
+
+        self.assertFalse(hasattr(factory, "__dict__"))
+        self.assertEqual(factory.attributes, {"name": "Slots Document"})
+
     def test_attributes_property_combines_defaults_and_traits(self) -> None:
         """Test that attributes property correctly combines default_attributes and traits"""
         factory = MockFactory("with_special_fields", "with_numbers")
@@ -410,6 +718,13 @@ class TestBaseFactory(unittest.TestCase):
 
         self.assertEqual(factory.attributes, expected_attributes)
 
+    def test_attributes_property_with_no_traits_returns_a_copy(self) -> None:
+        """Test that attributes property doesn't hand out default_attributes itself"""
+        factory = MockFactoryConstantAttributes()
+
+        self.assertEqual(factory.attributes, MockFactoryConstantAttributes._defaults)
+        self.assertIsNot(factory.attributes, MockFactoryConstantAttributes._defaults)
+
 
 if __name__ == "__main__":
     unittest.main()
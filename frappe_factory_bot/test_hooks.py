@@ -0,0 +1,61 @@
+import inspect
+import json
+import unittest
+from importlib.resources import files
+
+from frappe_factory_bot import hooks
+
+
+class TestHooks(unittest.TestCase):
+    """Tests for the hooks module serving hooks.json"""
+
+    def setUp(self) -> None:
+        """Set up test environment"""
+        self.expected_hooks = json.loads(
+            files("frappe_factory_bot").joinpath("hooks.json").read_bytes()
+        )
+
+    def test_dir_lists_exactly_the_hooks(self) -> None:
+        """Test that dir() only lists the hooks from hooks.json besides dunders"""
+        public_names = {name for name in dir(hooks) if not name.startswith("__")}
+
+        self.assertEqual(public_names, set(self.expected_hooks))
+
+    def test_getmembers_returns_exactly_the_hooks(self) -> None:
+        """Test that inspect.getmembers, which Frappe uses to collect hooks, only sees the hooks"""
+        members = {
+            name: value
+            for name, value in inspect.getmembers(hooks)
+            if not name.startswith("__")
+        }
+
+        self.assertEqual(members, self.expected_hooks)
+
+    def test_getattr_returns_hook_values(self) -> None:
+        """Test that each hook is available as a module attribute"""
+        for name, value in self.expected_hooks.items():
+            with self.subTest(name=name):
+                self.assertEqual(getattr(hooks, name), value)
+
+        self.assertEqual(hooks.app_name, "frappe_factory_bot")
+
+    def test_unknown_hook_raises_attribute_error(self) -> None:
+        """Test that accessing a hook that is not defined raises AttributeError"""
+        with self.assertRaises(AttributeError) as context:
+            _ = hooks.scheduler_events
+
+        self.assertIn("scheduler_events", str(context.exception))
+        self.assertFalse(hasattr(hooks, "doc_events"))
+
+    def test_get_hooks_is_read_only(self) -> None:
+        """Test that get_hooks() returns the same read-only mapping on every call"""
+        app_hooks = hooks.get_hooks()
+
+        self.assertEqual(dict(app_hooks), self.expected_hooks)
+        self.assertIs(hooks.get_hooks(), app_hooks)
+        with self.assertRaises(TypeError):
+            app_hooks["app_name"] = "other_app"  # type: ignore[index]
+
+
+if __name__ == "__main__":
+    unittest.main()